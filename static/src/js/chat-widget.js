@@ -0,0 +1,478 @@
+// Configuration (rendered per page into window.TRUTHGUARD by base.html)
+const GEMINI_AVAILABLE = window.TRUTHGUARD.geminiAvailable;
+const GEMINI_MODEL = window.TRUTHGUARD.geminiModel;
+const SERVER_ENDPOINT = "/api/chat";
+const SIMPLE_ENDPOINT = "/api/chat/simple";
+
+// Chatbot variables
+let chatHistory = [];
+let isLoggedIn = window.TRUTHGUARD.isLoggedIn;
+let isAdmin = window.TRUTHGUARD.isAdmin;
+let lastUserMessage = "";
+let isProcessing = false;
+
+// Show chat modal
+function showChat() {
+    const modalElement = document.getElementById('chatbotModal');
+    const modal = new bootstrap.Modal(modalElement);
+    modal.show();
+
+    // Scroll to bottom of chat
+    setTimeout(() => {
+        const container = document.getElementById('chatContainer');
+        if (container) {
+            container.scrollTop = container.scrollHeight;
+        }
+    }, 100);
+}
+
+// Send message function
+async function sendMessage() {
+    const messageInput = document.getElementById('messageInput');
+    if (!messageInput || isProcessing) return;
+
+    const message = messageInput.value.trim();
+    if (!message) return;
+
+    // Add user message
+    addMessage(message, false);
+    lastUserMessage = message;
+
+    // Clear input
+    messageInput.value = '';
+    updateCharCount();
+
+    // Show loading indicator
+    showLoading(true);
+
+    try {
+        // Try main chat endpoint
+        await getChatResponse(message);
+    } catch (error) {
+        console.error('Error getting response:', error);
+        // Fallback to simple endpoint
+        try {
+            await getSimpleChatResponse(message);
+        } catch (simpleError) {
+            console.error('Simple chat error:', simpleError);
+            const fallbackResponse = generateFallbackResponse(message);
+            addMessage(fallbackResponse, true);
+            showLoading(false);
+        }
+    }
+}
+
+// Get response from main chat API
+async function getChatResponse(message) {
+    const response = await fetch(SERVER_ENDPOINT, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+            message: message,
+            session_id: 'web_chat_' + new Date().getTime()
+        })
+    });
+
+    if (!response.ok) {
+        throw new Error(`HTTP error! status: ${response.status}`);
+    }
+
+    const data = await response.json();
+
+    if (data.success) {
+        addMessage(data.response, true);
+        chatHistory.push({
+            sender: 'TruthGuard AI',
+            text: data.response,
+            time: new Date().toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' }),
+            isBot: true,
+            model: data.model || 'unknown'
+        });
+    } else {
+        throw new Error(data.error || 'Unknown error');
+    }
+
+    showLoading(false);
+}
+
+// Get response from simple chat API
+async function getSimpleChatResponse(message) {
+    const response = await fetch(SIMPLE_ENDPOINT, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+            message: message
+        })
+    });
+
+    if (!response.ok) {
+        throw new Error(`HTTP error! status: ${response.status}`);
+    }
+
+    const data = await response.json();
+
+    if (data.success) {
+        addMessage(data.response, true);
+        chatHistory.push({
+            sender: 'TruthGuard AI',
+            text: data.response,
+            time: new Date().toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' }),
+            isBot: true,
+            model: 'simple'
+        });
+    } else {
+        throw new Error(data.error || 'Unknown error');
+    }
+
+    showLoading(false);
+}
+
+// Generate fallback response
+function generateFallbackResponse(message) {
+    const lowerMessage = message.toLowerCase();
+
+    if (lowerMessage.includes('fake news') || lowerMessage.includes('misinformation') || lowerMessage.includes('fact check')) {
+        return `
+        <strong>Fake News Detection Guide:</strong><br><br>
+        1. 🔍 <strong>Source Verification</strong><br>
+           • Check the website's "About Us" page<br>
+           • Look for contact information<br>
+           • Verify author credentials<br><br>
+
+        2. 📝 <strong>Content Analysis</strong><br>
+           • Watch for emotional language<br>
+           • Check for spelling/grammar errors<br>
+           • Look for cited sources<br><br>
+
+        3. 🏢 <strong>Cross-Referencing</strong><br>
+           • Search the topic on reputable sites<br>
+           • Check fact-checking organizations<br><br>
+
+        <strong>Recommended Fact-Checkers:</strong><br>
+        • Snopes.com<br>
+        • FactCheck.org<br>
+        • PolitiFact.com<br>
+        • Reuters Fact Check<br>
+        `;
+    }
+    else if (lowerMessage.includes('analyze') || lowerMessage.includes('check') || lowerMessage.includes('url')) {
+        return `
+        🔍 <strong>Content Analysis Instructions:</strong><br><br>
+        1. Go to the <a href="/analyze" class="text-primary" target="_blank">Analysis page</a><br>
+        2. Paste the text or URL you want to check<br>
+        3. Click "Analyze Content"<br>
+        4. Review the detailed report<br><br>
+
+        <strong>What we analyze:</strong><br>
+        • Source credibility score<br>
+        • Emotional language detection<br>
+        • Factual accuracy indicators<br>
+        • Bias detection<br><br>
+        `;
+    }
+    else {
+        return `
+        I understand you're asking about "${message}".<br><br>
+
+        <strong>As your TruthGuard assistant, I can help with:</strong><br><br>
+        • Content analysis for misinformation<br>
+        • Source credibility assessment<br>
+        • Fact-checking guidance<br>
+        • Misinformation pattern recognition<br><br>
+
+        <div class="alert alert-info mb-0">
+            <i class="fas fa-info-circle me-2"></i>
+            <strong>AI Status:</strong> ${GEMINI_AVAILABLE ? 'Gemini AI Active' : 'Using enhanced responses'}
+        </div>
+        `;
+    }
+}
+
+// Add message to chat
+function addMessage(text, isBot = true) {
+    const chatContainer = document.getElementById('chatContainer');
+    if (!chatContainer) return;
+
+    const time = new Date().toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' });
+
+    const messageClass = isBot ? 'bot-message' : 'user-message';
+    const senderName = isBot ? 'TruthGuard AI' : 'You';
+    const avatarIcon = isBot ? 'fa-robot' : 'fa-user';
+    const avatarClass = isBot ? 'bg-gradient-primary' : 'bg-gradient-success';
+
+    const messageDiv = document.createElement('div');
+    messageDiv.className = `chat-message ${messageClass} animate__animated animate__fadeIn`;
+    messageDiv.innerHTML = `
+        <div class="message-avatar">
+            <div class="avatar-circle ${avatarClass}">
+                <i class="fas ${avatarIcon}"></i>
+            </div>
+        </div>
+        <div class="message-content">
+            <div class="message-header">
+                <span class="message-sender">${senderName}</span>
+                <span class="message-time">${time}</span>
+            </div>
+            <div class="message-text">${text}</div>
+        </div>
+    `;
+
+    chatContainer.appendChild(messageDiv);
+
+    if (isBot) {
+        chatHistory.push({ sender: senderName, text, time, isBot });
+    }
+
+    // Scroll to bottom
+    chatContainer.scrollTop = chatContainer.scrollHeight;
+}
+
+// Show/hide loading indicator
+function showLoading(show) {
+    const progressBar = document.getElementById('loadingProgress');
+    const sendButton = document.getElementById('sendButton');
+
+    if (progressBar) {
+        progressBar.style.display = show ? 'block' : 'none';
+    }
+
+    if (sendButton) {
+        sendButton.disabled = show;
+        sendButton.innerHTML = show ?
+            '<i class="fas fa-spinner fa-spin"></i>' :
+            '<i class="fas fa-paper-plane"></i>';
+    }
+
+    isProcessing = show;
+}
+
+// Clear chat
+function clearChat() {
+    if (confirm('Clear chat history?')) {
+        const chatContainer = document.getElementById('chatContainer');
+        if (!chatContainer) return;
+
+        const welcomeTime = new Date().toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' });
+
+        chatContainer.innerHTML = `
+            <div class="chat-message bot-message">
+                <div class="message-avatar">
+                    <div class="avatar-circle bg-gradient-primary">
+                        <i class="fas fa-robot"></i>
+                    </div>
+                </div>
+                <div class="message-content">
+                    <div class="message-header">
+                        <span class="message-sender">TruthGuard AI</span>
+                        <span class="message-time">${welcomeTime}</span>
+                    </div>
+                    <div class="message-text">
+                        <p>👋 Hello! I'm your TruthGuard AI Assistant${GEMINI_AVAILABLE ? ', powered by ' + GEMINI_MODEL : ''}.</p>
+                        <p>I can help you with:</p>
+                        <ul class="list-unstyled mb-0">
+                            <li><i class="fas fa-check-circle text-success me-2"></i>Analyzing text for misinformation</li>
+                            <li><i class="fas fa-link text-primary me-2"></i>Checking URLs for credibility</li>
+                            <li><i class="fas fa-lightbulb text-warning me-2"></i>Fact-checking assistance</li>
+                            <li><i class="fas fa-shield-alt text-info me-2"></i>Source verification</li>
+                            <li><i class="fas fa-search text-danger me-2"></i>Misinformation detection</li>
+                        </ul>
+                        <p class="mt-3">What would you like to check today?</p>
+                    </div>
+                </div>
+            </div>
+        `;
+        chatHistory = [];
+    }
+}
+
+// Regenerate last response
+function regenerateResponse() {
+    if (!lastUserMessage || isProcessing) return;
+
+    // Remove last bot response from chat
+    const chatContainer = document.getElementById('chatContainer');
+    const messages = chatContainer.querySelectorAll('.chat-message.bot-message');
+    if (messages.length > 0) {
+        const lastBotMessage = messages[messages.length - 1];
+        lastBotMessage.remove();
+    }
+
+    // Remove from history
+    chatHistory = chatHistory.filter(msg => !msg.isBot || msg.text !== lastUserMessage);
+
+    // Send message again
+    const messageInput = document.getElementById('messageInput');
+    if (messageInput) {
+        messageInput.value = lastUserMessage;
+        sendMessage();
+    }
+}
+
+// Copy chat to clipboard
+function copyChat() {
+    const chatText = chatHistory.map(msg =>
+        `${msg.sender} (${msg.time}): ${msg.text.replace(/<[^>]*>/g, '')}`
+    ).join('\n');
+
+    navigator.clipboard.writeText(chatText).then(() => {
+        // Show temporary notification
+        const originalHTML = document.getElementById('copyChatBtn').innerHTML;
+        document.getElementById('copyChatBtn').innerHTML = '<i class="fas fa-check"></i>';
+        setTimeout(() => {
+            document.getElementById('copyChatBtn').innerHTML = originalHTML;
+        }, 2000);
+    }).catch(err => {
+        console.error('Failed to copy: ', err);
+    });
+}
+
+// Character count
+function updateCharCount() {
+    const messageInput = document.getElementById('messageInput');
+    if (!messageInput) return;
+
+    const text = messageInput.value;
+    const count = text.length;
+    const charCountElement = document.getElementById('charCount');
+
+    if (charCountElement) {
+        charCountElement.textContent = count;
+
+        if (count > 900) {
+            charCountElement.className = 'text-warning';
+        } else if (count > 1000) {
+            charCountElement.className = 'text-danger';
+        } else {
+            charCountElement.className = '';
+        }
+    }
+}
+
+// Initialize when page loads
+document.addEventListener('DOMContentLoaded', function() {
+    console.log('TruthGuard Chatbot Initialized');
+    console.log('Gemini Available:', GEMINI_AVAILABLE);
+    console.log('Gemini Model:', GEMINI_MODEL);
+
+    // Set current year
+    const currentYearElement = document.getElementById('currentYear');
+    if (currentYearElement) {
+        currentYearElement.textContent = new Date().getFullYear();
+    }
+
+    // Set welcome time
+    const welcomeTimeElement = document.getElementById('welcomeTime');
+    if (welcomeTimeElement) {
+        welcomeTimeElement.textContent = new Date().toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' });
+    }
+
+    // Character count for chat input
+    const messageInput = document.getElementById('messageInput');
+    if (messageInput) {
+        messageInput.addEventListener('input', updateCharCount);
+        updateCharCount();
+
+        // Enter key to send (Shift+Enter for new line)
+        messageInput.addEventListener('keydown', function(e) {
+            if (e.key === 'Enter' && !e.shiftKey) {
+                e.preventDefault();
+                sendMessage();
+            }
+        });
+
+        // Auto-resize textarea
+        messageInput.addEventListener('input', function() {
+            this.style.height = 'auto';
+            this.style.height = (this.scrollHeight) + 'px';
+        });
+    }
+
+    // Send button
+    const sendButton = document.getElementById('sendButton');
+    if (sendButton) {
+        sendButton.addEventListener('click', sendMessage);
+    }
+
+    // Clear chat button
+    const clearChatBtn = document.getElementById('clearChatBtn');
+    if (clearChatBtn) {
+        clearChatBtn.addEventListener('click', clearChat);
+    }
+
+    // Copy chat button
+    const copyChatBtn = document.getElementById('copyChatBtn');
+    if (copyChatBtn) {
+        copyChatBtn.addEventListener('click', copyChat);
+    }
+
+    // Regenerate button
+    const regenerateBtn = document.getElementById('regenerateBtn');
+    if (regenerateBtn) {
+        regenerateBtn.addEventListener('click', regenerateResponse);
+    }
+
+    // Floating chat button
+    const floatingChatBtn = document.getElementById('floatingChatBtn');
+    if (floatingChatBtn) {
+        floatingChatBtn.addEventListener('click', showChat);
+    }
+
+    // Footer chat link
+    const openChatFromFooter = document.getElementById('openChatFromFooter');
+    if (openChatFromFooter) {
+        openChatFromFooter.addEventListener('click', function(e) {
+            e.preventDefault();
+            showChat();
+        });
+    }
+
+    // Suggestion chips
+    const suggestionChips = document.querySelectorAll('.suggestion-chip');
+    suggestionChips.forEach(chip => {
+        chip.addEventListener('click', function() {
+            const message = this.getAttribute('data-message');
+            if (message) {
+                const messageInput = document.getElementById('messageInput');
+                if (messageInput) {
+                    messageInput.value = message;
+                    sendMessage();
+                }
+            }
+        });
+    });
+
+    // Navbar scroll effect
+    window.addEventListener('scroll', function() {
+        const navbar = document.querySelector('.navbar');
+        if (navbar) {
+            if (window.scrollY > 50) {
+                navbar.classList.add('scrolled');
+            } else {
+                navbar.classList.remove('scrolled');
+            }
+        }
+    });
+
+    // Auto-dismiss alerts
+    setTimeout(function() {
+        const alerts = document.querySelectorAll('.alert');
+        alerts.forEach(alert => {
+            const bsAlert = new bootstrap.Alert(alert);
+            bsAlert.close();
+        });
+    }, 5000);
+
+    // Auto-show chat on first visit (once per session)
+    if (!sessionStorage.getItem('truthguardChatShown')) {
+        setTimeout(() => {
+            showChat();
+            sessionStorage.setItem('truthguardChatShown', 'true');
+        }, 3000);
+    }
+
+    console.log('Chatbot initialized successfully!');
+});
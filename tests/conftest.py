@@ -0,0 +1,89 @@
+import importlib.machinery
+import importlib.util
+import os
+import sys
+
+import pytest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'milestone 1')
+LEXICON = 'good\t1.9\t0.9\t[2, 2, 2]\nbad\t-2.5\t0.5\t[-3, -2, -3]\nshocking\t-1.8\t0.7\t[-2, -2, -1]\n'
+
+
+def app_environ(workdir):
+    """Environment that keeps every file the app writes inside workdir"""
+    return dict(os.environ,
+                TRUTHGUARD_RESOURCE_PACK=os.path.join(workdir, 'resources.pack'),
+                USER_CACHE_SHARED_PATH=os.path.join(workdir, 'user_cache.gen'),
+                METRICS_SHARED_DIR=os.path.join(workdir, 'metrics'),
+                RATE_LIMIT_DB=os.path.join(workdir, 'ratelimits.db'),
+                GEMINI_API_KEY='')
+
+
+def load_app(workdir):
+    """Import "milestone 1" as the truthguard module and bind it to a database in workdir
+
+    The caller must already have applied app_environ(workdir); module-level settings are read at import.
+    """
+    loader = importlib.machinery.SourceFileLoader('truthguard', APP_PATH)
+    spec = importlib.util.spec_from_loader('truthguard', loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['truthguard'] = module
+    loader.exec_module(module)
+
+    os.chdir(workdir)  # uploads/ and logs/ are relative to the working directory
+    module.app.instance_path = os.path.join(workdir, 'instance')
+    if not os.path.exists(os.environ['TRUTHGUARD_RESOURCE_PACK']):
+        lexicon_path = os.path.join(workdir, 'vader_lexicon.txt')
+        with open(lexicon_path, 'w', encoding='utf-8') as f:
+            f.write(LEXICON)
+        module.build_resource_pack(os.environ['TRUTHGUARD_RESOURCE_PACK'], vader_lexicon_path=lexicon_path)
+    module.create_app({'TESTING': True,
+                       'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(workdir, 'truthguard.db')}"})
+    return module
+
+
+@pytest.fixture(scope='session')
+def workdir(tmp_path_factory):
+    return str(tmp_path_factory.mktemp('truthguard'))
+
+
+@pytest.fixture(scope='session')
+def tg(workdir):
+    """The app module, loaded once per test session"""
+    cwd = os.getcwd()
+    with pytest.MonkeyPatch.context() as mp:
+        for key, value in app_environ(workdir).items():
+            mp.setenv(key, value)
+        yield load_app(workdir)
+    os.chdir(cwd)
+
+
+@pytest.fixture
+def make_user(tg):
+    """Create a committed user and return its id"""
+    counter = iter(range(1, 1 << 30))
+
+    def make(**values):
+        with tg.app.app_context():
+            user = tg.User(email=f'user{next(counter)}-{os.urandom(4).hex()}@example.com', name='Test User',
+                           password=tg.generate_password_hash('secret1', method='pbkdf2:sha256'), **values)
+            tg.db.session.add(user)
+            tg.db.session.commit()
+            return user.id
+
+    return make
+
+
+@pytest.fixture
+def statements(tg):
+    """SQL statements run against the app's engine during the test"""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    with tg.app.app_context():
+        engine = tg.db.engine
+    tg.event.listen(engine, 'before_cursor_execute', record)
+    yield executed
+    tg.event.remove(engine, 'before_cursor_execute', record)
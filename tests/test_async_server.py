@@ -0,0 +1,141 @@
+import asyncio
+import json
+
+import pytest
+from flask import Response, jsonify, request
+from werkzeug.exceptions import Conflict
+
+ARTICLE = ('The council voted on Tuesday after a two-year study of the water supply, and the official '
+           'report covers the data published by the city.')
+
+
+class Rejected(Exception):
+    pass
+
+
+def http_scope(path, method='GET', query_string=b'', headers=(), root_path=''):
+    return {'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': method,
+            'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'root_path': root_path,
+            'query_string': query_string, 'headers': list(headers), 'server': ('testserver', 8000),
+            'client': ('10.0.0.7', 51234)}
+
+
+def call(server, scope, body=b''):
+    """Run one request through the ASGI app; returns (status, headers, body messages)"""
+    messages = [{'type': 'http.request', 'body': body[:len(body) // 2], 'more_body': True},
+                {'type': 'http.request', 'body': body[len(body) // 2:]}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(server(scope, receive, send))
+    start, bodies = sent[0], sent[1:]
+    assert start['type'] == 'http.response.start'
+    assert bodies and bodies[-1] == {'type': 'http.response.body', 'body': b''}
+    return start['status'], {name.decode(): value.decode() for name, value in start['headers']}, bodies[:-1]
+
+
+def session_cookie(tg, user_id):
+    client = tg.app.test_client()
+    with tg.app.app_context():
+        email = tg.db.session.get(tg.User, user_id).email
+    client.post('/login', data={'email': email, 'password': 'secret1'})
+    return client.get_cookie('session').value
+
+
+@pytest.fixture
+def server(tg):
+    server = tg.AsyncServer(cpu_threads=2, wsgi_threads=4)
+    yield server
+    server.cpu_pool.shutdown()
+    server.wsgi_pool.shutdown()
+
+
+def test_environ_maps_scope_and_body(tg):
+    scope = http_scope('/api/café', method='POST', query_string=b'q=caf%C3%A9&page=2', root_path='/tg', headers=[
+        (b'content-type', b'application/json'), (b'content-length', b'999'),
+        (b'x-tag', b'a'), (b'x-tag', b'b'), (b'user-agent', b'pytest')])
+    environ = tg.asgi_to_wsgi_environ(scope, b'{"k": 1}')
+
+    assert environ['REQUEST_METHOD'] == 'POST'
+    assert (environ['SCRIPT_NAME'], environ['QUERY_STRING']) == ('/tg', 'q=caf%C3%A9&page=2')
+    assert (environ['SERVER_NAME'], environ['SERVER_PORT']) == ('testserver', '8000')
+    assert (environ['REMOTE_ADDR'], environ['REMOTE_PORT']) == ('10.0.0.7', '51234')
+    assert environ['CONTENT_TYPE'] == 'application/json'
+    assert environ['CONTENT_LENGTH'] == '8'  # from the body actually read, not the header
+    assert environ['HTTP_X_TAG'] == 'a,b'
+    assert environ['HTTP_USER_AGENT'] == 'pytest'
+    assert 'HTTP_CONTENT_TYPE' not in environ and 'HTTP_CONTENT_LENGTH' not in environ
+
+    with tg.app.request_context(environ):
+        assert request.path == '/api/café'
+        assert request.script_root == '/tg'
+        assert request.args.to_dict() == {'q': 'café', 'page': '2'}
+        assert request.get_json() == {'k': 1}
+        assert request.url == 'http://testserver:8000/tg/api/café?q=café&page=2'
+
+
+def test_streamed_response_is_sent_chunk_by_chunk(tg, server, monkeypatch):
+    def streamed():
+        return Response((f'row {i}\n' for i in range(3)), mimetype='text/csv')
+
+    monkeypatch.setitem(tg.app.view_functions, 'health_check', streamed)
+    status, headers, bodies = call(server, http_scope('/api/health'))
+
+    assert status == 200 and headers['content-type'].startswith('text/csv')
+    assert [message['body'] for message in bodies] == [b'row 0\n', b'row 1\n', b'row 2\n']
+    assert all(message['more_body'] for message in bodies)
+
+
+def test_step_view_errors_reach_flask_error_handlers(tg, server, monkeypatch):
+    def reject():
+        raise Rejected('no')
+
+    @tg.step_view
+    def failing_step():
+        yield tg.Await('cpu', reject)
+        return jsonify({'unreachable': True})
+
+    @tg.step_view
+    def conflicting_step():
+        yield tg.Await('cpu', len, 'abc')
+        raise Conflict()
+
+    monkeypatch.setitem(tg.app.error_handler_spec[None][None], Rejected,
+                        lambda e: (jsonify({'handled': str(e)}), 418))
+    monkeypatch.setitem(tg.app.view_functions, 'simple_chat', failing_step)
+    monkeypatch.setitem(tg.app.view_functions, 'gemini_chat', conflicting_step)
+
+    status, headers, bodies = call(server, http_scope('/api/chat/simple', method='POST'))
+    assert status == 418
+    assert json.loads(b''.join(message['body'] for message in bodies)) == {'handled': 'no'}
+
+    status, _, _ = call(server, http_scope('/api/gemini/chat', method='POST'))
+    assert status == 409
+
+
+def test_db_step_saves_analysis(tg, server, make_user):
+    user_id = make_user()
+    cookie = session_cookie(tg, user_id)
+    kinds = []
+    run = server.run
+
+    async def recording_run(step):
+        kinds.append(step.kind)
+        return await run(step)
+
+    server.run = recording_run
+    status, _, bodies = call(server, http_scope('/api/gemini/analyze', method='POST', headers=[
+        (b'content-type', b'application/json'), (b'cookie', f'session={cookie}'.encode())]),
+        json.dumps({'content': ARTICLE}).encode())
+
+    result = json.loads(b''.join(message['body'] for message in bodies))
+    assert status == 200 and result['success'], result
+    assert kinds[-1] == 'db'
+    with tg.app.app_context():
+        analysis = tg.db.session.get(tg.Analysis, result['analysis_id'])
+        assert (analysis.user_id, analysis.content) == (user_id, ARTICLE)
@@ -0,0 +1,88 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+DEACTIVATE = textwrap.dedent('''
+    import sys
+    sys.path.insert(0, sys.argv[1])
+    from conftest import load_app
+
+    tg = load_app(sys.argv[2])
+    with tg.app.app_context():
+        user = tg.db.session.get(tg.User, int(sys.argv[3]))
+        user.is_active = False
+        tg.db.session.commit()
+''')
+
+
+def load(tg, user_id):
+    """load_user as Flask-Login calls it, in a fresh request context"""
+    with tg.app.test_request_context():
+        user = tg.load_user(str(user_id))
+        return user and {column.key: getattr(user, column.key) for column in tg.User.__table__.columns}
+
+
+def test_deactivation_in_another_process_invalidates_cached_user(tg, workdir, make_user):
+    user_id = make_user()
+    assert load(tg, user_id)['is_active'] is True
+    assert tg.user_cache.get(user_id) is not None
+
+    # Another worker process writes the row; only the shared generations file tells this process about it
+    subprocess.run([sys.executable, '-c', DEACTIVATE, os.path.dirname(__file__), workdir, str(user_id)],
+                   env=dict(os.environ), check=True, capture_output=True)
+
+    assert tg.user_cache.get(user_id) is None
+    assert load(tg, user_id)['is_active'] is False
+
+
+def test_rollback_keeps_cached_user(tg, make_user):
+    user_id = make_user()
+    load(tg, user_id)
+    generation = tg.user_cache.generation(user_id)
+
+    with tg.app.app_context():
+        tg.db.session.get(tg.User, user_id).is_active = False
+        tg.db.session.flush()
+        # Flushed but not committed: other requests must keep reading the committed row
+        assert tg.user_cache.get(user_id) is not None
+        tg.db.session.rollback()
+
+    assert tg.user_cache.generation(user_id) == generation
+    assert tg.user_cache.get(user_id)['is_active'] is True
+
+
+def test_commit_invalidates_cached_user(tg, make_user):
+    user_id = make_user()
+    load(tg, user_id)
+
+    with tg.app.app_context():
+        tg.db.session.get(tg.User, user_id).role = 'admin'
+        tg.db.session.commit()
+
+    assert tg.user_cache.get(user_id) is None
+    assert load(tg, user_id)['role'] == 'admin'
+
+
+def test_merged_cached_user_updates_without_select_or_stale_overwrite(tg, make_user, statements):
+    user_id = make_user()
+    load(tg, user_id)
+    with tg.app.app_context():
+        # A raw UPDATE does not invalidate the cache, so the cached copy is now stale for avatar
+        tg.db.session.execute(tg.text('UPDATE user SET avatar = :avatar WHERE id = :id'),
+                              {'avatar': 'new.png', 'id': user_id})
+        tg.db.session.commit()
+
+    statements.clear()
+    with tg.app.test_request_context():
+        user = tg.load_user(str(user_id))
+        assert user.avatar == 'default.png'  # served from the cache
+        user.name = 'Renamed'
+        tg.db.session.commit()
+
+    assert not [statement for statement in statements if statement.lstrip().upper().startswith('SELECT')]
+    updates = [statement for statement in statements if statement.lstrip().upper().startswith('UPDATE')]
+    assert len(updates) == 1 and 'name' in updates[0] and 'avatar' not in updates[0]
+    with tg.app.app_context():
+        user = tg.db.session.get(tg.User, user_id)
+        assert (user.name, user.avatar) == ('Renamed', 'new.png')